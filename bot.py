@@ -11,7 +11,7 @@ Commands (slash commands: /)
    → Replies with sprite/splash availability for that character.
 
 3) /ping
-   → Replies with pong.
+   → Replies with pong and the gateway heartbeat latency.
 
 4) /artist name: "Artist Name" (optional: kind = splash / sprite / both)
    → Shows all characters whose sprite or splash art was created by the specified artist.
@@ -29,6 +29,13 @@ Quick Start
    - SHEET_NAME = the tab name (default: "Characters")
    - AVAILABLE_VALUES = comma-separated values considered available (default: "y")
    - UNAVAILABLE_VALUES = comma-separated values considered unavailable (default: "n")
+   - CACHE_FILE = optional path where fetched rows are saved so a restarted
+     instance can answer from them while it re-fetches (default: disabled)
+   - CACHE_HARD_TTL_SECS = a CACHE_FILE older than this is ignored at startup
+     (default: 86400)
+   - CACHE_STALE_TTL_SECS = after CACHE_TTL_SECS, cached rows are still served (while
+     a background refresh runs) until they are this old; rows restored from
+     CACHE_FILE get this long from startup (default: 600)
 
 Sheet layout (first row is headers):
 ------------------------------------
@@ -44,21 +51,27 @@ H: Sprite Art Artist (Alternate)
 
 from __future__ import annotations
 import asyncio
-import difflib
+import functools
+import heapq
 import json
 import logging
+import math
 import os
 import re
+import sys
 import time
 import unicodedata
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 
 
 import discord
 from discord.ext import commands
 from discord import app_commands
+import orjson
+from rapidfuzz import fuzz, process
 
 import gspread
 from google.oauth2.service_account import Credentials
@@ -72,21 +85,29 @@ from google.auth import default as google_auth_default
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID")
 SHEET_NAME = os.getenv("SHEET_NAME", "Characters")
+SHEET_RANGE = "A2:F"
+_SHEET_WIDTH = 6  # columns A-F
 GOOGLE_SHEET_URL = os.getenv(
     "GOOGLE_SHEET_URL",
     "https://docs.google.com/spreadsheets/d/1Sud0s7EbgAfBCHR7w21OmnYF-VcG64O8WGM1ixYoRz0/edit?gid=0#gid=0",
 )
-AVAILABLE_VALUES = set(
-    v.strip().lower()
+AVAILABLE_VALUES = frozenset(
+    sys.intern(v.strip().lower())
     for v in os.getenv("AVAILABLE_VALUES", "y").split(",")
     if v.strip()
 )
-UNAVAILABLE_VALUES = set(
-    v.strip().lower()
+UNAVAILABLE_VALUES = frozenset(
+    sys.intern(v.strip().lower())
     for v in os.getenv("UNAVAILABLE_VALUES", "n").split(",")
     if v.strip()
 )
 CACHE_TTL_SECS = int(os.getenv("CACHE_TTL_SECS", "60"))
+# /available lookups running in the default to_thread pool at once, so a burst
+# of them can't take every worker
+MAX_CONCURRENT_LOOKUPS = 8
+CACHE_FILE = os.getenv("CACHE_FILE")
+CACHE_HARD_TTL_SECS = int(os.getenv("CACHE_HARD_TTL_SECS", "86400"))
+CACHE_STALE_TTL_SECS = int(os.getenv("CACHE_STALE_TTL_SECS", "600"))
 
 SERVICE_ACCOUNT_JSON = os.getenv("SERVICE_ACCOUNT_JSON")
 SERVICE_ACCOUNT_FILE = os.getenv("SERVICE_ACCOUNT_FILE", "service_account.json")
@@ -95,7 +116,43 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("polandball-bot")
 
 
-@dataclass
+# One lookup instead of two set tests; AVAILABLE_VALUES wins if a value is in both
+_STATUS_MAP: Dict[str, bool] = {
+    **{v: False for v in UNAVAILABLE_VALUES},
+    **{v: True for v in AVAILABLE_VALUES},
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_flag(raw: str) -> Optional[bool]:
+    """Map a cell to True/False via AVAILABLE_VALUES/UNAVAILABLE_VALUES, else None.
+
+    Sheets repeat a handful of values ("Y", "n", the same artist names), so
+    results are memoized instead of re-stripping and lowercasing every row.
+    """
+    return _STATUS_MAP.get(raw.strip().lower())
+
+
+def parse_in_game(raw: str) -> Optional[bool]:
+    """Return True/False/None for the 'In Game?' column.
+
+    - Returns True if the cell matches `AVAILABLE_VALUES`.
+    - Returns False if it matches `UNAVAILABLE_VALUES`.
+    - Returns None if empty or unknown.
+    """
+    if not raw:
+        return None
+    return parse_flag(raw)
+
+
+def parse_availability(raw: str) -> bool:
+    if not raw:
+        return True  # Empty = available
+    # Any non-empty value (if not in AVAILABLE_VALUES) = unavailable
+    return parse_flag(raw) is True
+
+
+@dataclass(frozen=True, slots=True)
 class CountryRecord:
     country: str
     in_game: str
@@ -103,40 +160,42 @@ class CountryRecord:
     splash_rdy: str
     sprite_artist: str
     sprite_rdy: str
+    splash: bool
+    sprite: bool
+    in_game_status: Optional[bool]
+    norm: str
+    splash_artist_norm: str
+    sprite_artist_norm: str
+    splash_ready_label: str
+    sprite_ready_label: str
 
-    def _parse(self, raw: str) -> Optional[bool]:
-        if not raw:
-            return True  # Empty = available
-        s = raw.strip().lower()
-        if s in AVAILABLE_VALUES:
-            return True
-        if s in UNAVAILABLE_VALUES:
-            return False
-        return False  # Any non-empty value (if not in AVAILABLE_VALUES) = unavailable
-
-    def in_game_status(self) -> Optional[bool]:
-        """Return True/False/None for the 'In Game?' column.
-
-        - Returns True if the cell matches `AVAILABLE_VALUES`.
-        - Returns False if it matches `UNAVAILABLE_VALUES`.
-        - Returns None if empty or unknown.
-        """
-        raw = self.in_game
-        if not raw:
-            return None
-        s = raw.strip().lower()
-        if s in AVAILABLE_VALUES:
-            return True
-        if s in UNAVAILABLE_VALUES:
-            return False
-        return None
-
-    def is_available(self, kind: str) -> Optional[bool]:
-        if kind == "splash":
-            return self._parse(self.splash_artist)
-        if kind == "sprite":
-            return self._parse(self.sprite_artist)
-        return None
+    @classmethod
+    def from_sheet(
+        cls,
+        country: str,
+        in_game: str,
+        splash_artist: str,
+        splash_rdy: str,
+        sprite_artist: str,
+        sprite_rdy: str,
+    ) -> "CountryRecord":
+        """Build a record from raw cell values, parsing every status once."""
+        return cls(
+            country=country,
+            in_game=in_game,
+            splash_artist=splash_artist,
+            splash_rdy=splash_rdy,
+            sprite_artist=sprite_artist,
+            sprite_rdy=sprite_rdy,
+            splash=parse_availability(splash_artist),
+            sprite=parse_availability(sprite_artist),
+            in_game_status=parse_in_game(in_game),
+            norm=normalize_country(country),
+            splash_artist_norm=normalize_name(splash_artist),
+            sprite_artist_norm=normalize_name(sprite_artist),
+            splash_ready_label=format_ready_flag(splash_rdy),
+            sprite_ready_label=format_ready_flag(sprite_rdy),
+        )
 
 
 class SheetClient:
@@ -147,7 +206,7 @@ class SheetClient:
         ]
 
         if SERVICE_ACCOUNT_JSON:
-            info = json.loads(SERVICE_ACCOUNT_JSON)
+            info = orjson.loads(SERVICE_ACCOUNT_JSON)
             creds = Credentials.from_service_account_info(info, scopes=scopes)
         elif SERVICE_ACCOUNT_FILE and os.path.exists(SERVICE_ACCOUNT_FILE):
             creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
@@ -161,115 +220,332 @@ class SheetClient:
         logger.info("Connected to Google Sheet '%s' tab '%s'", GOOGLE_SHEET_ID, SHEET_NAME)
 
     def fetch_records(self) -> List[CountryRecord]:
-        values = self.sheet.get_all_values()
-
-        def col_letter_to_index(letter: str):
-            letter = (letter or "").strip()
-            if not letter or not letter.isalpha():
-                return None
-            idx = 0
-            for ch in letter.upper():
-                idx = idx * 26 + (ord(ch) - 64)
-            return idx - 1
-
-        in_game_i = col_letter_to_index("A")
-        character_i = col_letter_to_index("B")
-        splash_artist_i = col_letter_to_index("C")
-        splash_rdy_i = col_letter_to_index("D")
-        sprite_artist_i = col_letter_to_index("E")
-        sprite_rdy_i = col_letter_to_index("F")
+        # Only columns A-F are used; the range also skips the header row
+        values = self.sheet.get(SHEET_RANGE)
 
         records: List[CountryRecord] = []
 
-        for row in values[1:]:
-            in_game = (
-                row[in_game_i].strip()
-                if in_game_i is not None and in_game_i < len(row)
-                else ""
-            )
-
-            country = (
-                row[character_i].strip()
-                if character_i is not None and character_i < len(row)
-                else ""
-            )
-            splash_artist = (
-                row[splash_artist_i].strip()
-                if splash_artist_i is not None and splash_artist_i < len(row)
-                else ""
-            )
-            splash_rdy = (
-                row[splash_rdy_i].strip()
-                if splash_rdy_i is not None and splash_rdy_i < len(row)
-                else ""
-            )
-            sprite_artist = (
-                row[sprite_artist_i].strip()
-                if sprite_artist_i is not None and sprite_artist_i < len(row)
-                else ""
-            )
-            sprite_rdy = (
-                row[sprite_rdy_i].strip()
-                if sprite_rdy_i is not None and sprite_rdy_i < len(row)
-                else ""
-            )
+        for row in values:
+            # The API trims trailing empty cells, so pad short rows to A-F
+            cells = [c.strip() for c in row[:_SHEET_WIDTH]]
+            cells += [""] * (_SHEET_WIDTH - len(cells))
+            in_game, country, splash_artist, splash_rdy, sprite_artist, sprite_rdy = cells
 
             if country:
-                records.append(
-                    CountryRecord(
-                        country=country,
-                        in_game=in_game,
-                        splash_artist=splash_artist,
-                        splash_rdy=splash_rdy,
-                        sprite_artist=sprite_artist,
-                        sprite_rdy=sprite_rdy,
-                    )
+                record = CountryRecord.from_sheet(
+                    country=country,
+                    in_game=in_game,
+                    splash_artist=splash_artist,
+                    splash_rdy=splash_rdy,
+                    sprite_artist=sprite_artist,
+                    sprite_rdy=sprite_rdy,
                 )
+                # Names like "Ball" normalize to nothing and can't be looked up
+                if record.norm:
+                    records.append(record)
         return records
 
 
+_RECORD_COLUMNS = ("country", "in_game", "splash_artist", "splash_rdy", "sprite_artist", "sprite_rdy")
+
+
 class Cache:
-    def __init__(self, ttl: int):
+    def __init__(self, ttl: int, path: Optional[str] = None, hard_ttl: int = 86400, stale_ttl: int = 600):
         self.ttl = ttl
-        self._data: Optional[Tuple[float, List[CountryRecord]]] = None
+        self.path = path
+        self.hard_ttl = hard_ttl
+        self.stale_ttl = stale_ttl
+        self._data: Optional[Tuple[float, AvailabilityIndex]] = None
+        # Expired data may be served until this time; see get_stale()
+        self._stale_until = 0.0
+
+    def load(self):
+        """Blocking: restore the index saved in `path`, if any and not too old."""
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            ts = float(saved["ts"])
+            if time.time() - ts > self.hard_ttl:
+                return
+            records = [
+                CountryRecord.from_sheet(**{c: row.get(c, "") for c in _RECORD_COLUMNS})
+                for row in saved["records"]
+            ]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", self.path, e)
+            return
+        self._data = (ts, AvailabilityIndex.build(records))
+        self._stale_until = time.time() + self.stale_ttl
+        logger.info("Loaded %d cached record(s) from %s", len(records), self.path)
+
+    def save(self):
+        """Blocking: write the current index's rows to `path`, if one is set."""
+        if not self.path or not self._data:
+            return
+        ts, index = self._data
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"ts": ts, "records": [{c: getattr(r, c) for c in _RECORD_COLUMNS} for r in index.records]},
+                    f,
+                )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not write cache file %s: %s", self.path, e)
 
-    def get(self) -> Optional[List[CountryRecord]]:
+    def get(self) -> Optional[AvailabilityIndex]:
         if not self._data:
             return None
-        ts, data = self._data
+        ts, index = self._data
         if time.time() - ts > self.ttl:
             return None
-        return data
+        return index
+
+    def get_stale(self) -> Optional[AvailabilityIndex]:
+        """Return an expired index that may still be served while it is refreshed.
+
+        Fetched data qualifies for `stale_ttl` after it was fetched, so failing
+        refreshes can't keep it in use for long. Data restored from the cache
+        file (which `load` already limits to `hard_ttl`) gets `stale_ttl` from
+        startup, long enough to cover the first fetch.
+        """
+        if not self._data or time.time() > self._stale_until:
+            return None
+        return self._data[1]
 
-    def set(self, data: List[CountryRecord]):
-        self._data = (time.time(), data)
+    def set(self, index: AvailabilityIndex):
+        ts = time.time()
+        self._data = (ts, index)
+        self._stale_until = ts + self.stale_ttl
 
 
 _STOPWORDS = {"ball"}
 _WORDS_RE = re.compile(r"[\w']+")
 
 
-def normalize_country(text: str) -> str:
-    words = [w.lower() for w in _WORDS_RE.findall(text)]
-    words = [w for w in words if w not in _STOPWORDS]
-    return " ".join(words)
+@functools.lru_cache(maxsize=1024)
+def normalize_country(text: str, _findall=_WORDS_RE.findall, _is_stop=_STOPWORDS.__contains__) -> str:
+    # Defaults bind the tokenizer and stopword check as fast locals
+    return " ".join(w for w in map(str.lower, _findall(text)) if not _is_stop(w))
+
+
+_LEN_SLACK = 3
+_MIN_FUZZY_LEN = 3
+
+
+def trigrams(text: str) -> List[str]:
+    return [text[i:i + 3] for i in range(len(text) - 2)]
+
+
+# Helper to split long lists into multiple embed fields (Discord field limit ~1024 chars).
+# `values` must already be in display order.
+def fields_from_list(title: str, values: Sequence[str]) -> List[Tuple[str, str, bool]]:
+    if not values:
+        return [(f"{title} (0)", "_none_", False)]
+
+    max_len = 900
+    chunks: List[List[str]] = [[]]
+    current_len = 0  # length of "\n".join(chunks[-1])
+    for v in values:
+        line = f"• {v}"
+        current = chunks[-1]
+        added = len(line) + 1 if current else len(line)
+        if current and current_len + added > max_len:
+            chunks.append([line])
+            current_len = len(line)
+        else:
+            current.append(line)
+            current_len += added
+
+    fields: List[Tuple[str, str, bool]] = []
+    for i, chunk in enumerate(chunks, start=1):
+        name_suffix = f" (page {i})" if len(chunks) > 1 else ""
+        fields.append((f"{title} ({len(values)}){name_suffix}", "\n".join(chunk), False))
+    return fields
+
+
+# Word characters minus digits and underscore, i.e. letters (plus rare non-decimal numerals)
+_NON_LETTERS_RE = re.compile(r"[\W\d_]+")
+
+
+@functools.lru_cache(maxsize=2048)
+def normalize_name(s: str) -> str:
+    """
+    Normalize artist / query text for fuzzy matching:
+    - Unicode normalize (NFKD)
+    - keep only letters (drop emoji, punctuation, bullets, etc.)
+    - lowercase
+    """
+    if not s:
+        return ""
+    # decompose fancy unicode characters
+    s = unicodedata.normalize("NFKD", s)
+    # keep only alphabetic characters
+    s = _NON_LETTERS_RE.sub("", s)
+    return s.lower()
+
+
+ARTIST_FUZZY_THRESHOLD = 70  # rapidfuzz scores are 0-100
+
+
+@dataclass
+class ArtistIndex:
+    """Distinct artist names for one art kind, mapped to their records."""
+
+    names: List[str]
+    norms: List[str]
+    records: Dict[str, List[CountryRecord]]
+
+    @classmethod
+    def build(cls, records: List[CountryRecord], get_artist) -> "ArtistIndex":
+        """`get_artist(r)` returns the record's (artist name, normalized name)."""
+        by_artist: Dict[str, List[CountryRecord]] = defaultdict(list)
+        norm_of: Dict[str, str] = {}
+        for r in records:
+            raw, norm = get_artist(r)
+            if raw:
+                by_artist[raw].append(r)
+                norm_of[raw] = norm
+        names = list(by_artist)
+        return cls(
+            names=names,
+            norms=[norm_of[n] for n in names],
+            records=dict(by_artist),
+        )
+
+    def search(self, q: str) -> Dict[str, float]:
+        """Return {artist name: score} for artists matching normalized query `q`.
+
+        - If q is 1 letter, only exact 1-letter names match.
+        - If q (len >= 3) is a substring of the artist's name, it scores 100.
+        - Otherwise a fuzzy ratio over all names is scored in one rapidfuzz pass.
+        """
+        if not q:
+            return {}
+
+        # one-letter special case
+        if len(q) == 1:
+            return {n: 100.0 for n, t in zip(self.names, self.norms) if t == q}
+
+        scores: Dict[str, float] = {}
+        # substring boost: "bread" in "Bread_from_Seoul", "jose" in "Jose11santamari"
+        if len(q) >= 3:
+            for n, t in zip(self.names, self.norms):
+                if q in t:
+                    scores[n] = 100.0
+
+        for _, score, i in process.extract(
+            q,
+            self.norms,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=ARTIST_FUZZY_THRESHOLD,
+            limit=None,
+        ):
+            scores.setdefault(self.names[i], score)
+        return scores
 
 
 @dataclass
 class AvailabilityIndex:
+    records: List[CountryRecord]
     by_norm: Dict[str, CountryRecord]
-    all_names: List[str]
+    keys: Tuple[str, ...]
+    by_trigram: Dict[str, Set[str]]
+    tokens: Dict[str, List[str]]
+    by_len: Dict[int, List[str]]
+    sprite_available: Tuple[str, ...]
+    splash_available: Tuple[str, ...]
+    splash_artists: ArtistIndex
+    sprite_artists: ArtistIndex
+    ball_embed: discord.Embed
 
     @classmethod
     def build(cls, records: List[CountryRecord]) -> "AvailabilityIndex":
-        by_norm: Dict[str, CountryRecord] = {}
-        names: List[str] = []
-        for r in records:
-            key = normalize_country(r.country)
-            if key:
-                by_norm[key] = r
-                names.append(r.country)
-        return cls(by_norm=by_norm, all_names=sorted(set(names), key=str.lower))
+        by_norm = {r.norm: r for r in records if r.norm}
+
+        grams: Dict[str, Set[str]] = defaultdict(set)
+        tokens: Dict[str, List[str]] = defaultdict(list)
+        by_len: Dict[int, List[str]] = defaultdict(list)
+        for key in by_norm:
+            for g in trigrams(key):
+                grams[g].add(key)
+            for t in set(key.split()):
+                tokens[t].append(key)
+            by_len[len(key)].append(key)
+
+        # Sorted once here so every filtered list comes out already in display order
+        rows = sorted(by_norm.values(), key=lambda r: r.country.lower())
+        sprite_available = tuple(r.country for r in rows if r.sprite)
+        splash_available = tuple(r.country for r in rows if r.splash)
+
+        return cls(
+            records=records,
+            by_norm=by_norm,
+            keys=tuple(by_norm),
+            by_trigram=dict(grams),
+            tokens=dict(tokens),
+            by_len=dict(by_len),
+            sprite_available=sprite_available,
+            splash_available=splash_available,
+            splash_artists=ArtistIndex.build(records, lambda r: (r.splash_artist, r.splash_artist_norm)),
+            sprite_artists=ArtistIndex.build(records, lambda r: (r.sprite_artist, r.sprite_artist_norm)),
+            ball_embed=cls.render_ball_embed(sprite_available, splash_available),
+        )
+
+    @staticmethod
+    def render_ball_embed(sprite_available: Sequence[str], splash_available: Sequence[str]) -> discord.Embed:
+        """Render the `/available` list embed; `build` does this once per index.
+
+        The index is rebuilt whenever the sheet cache refreshes, so the embed is
+        never staler than the cached rows it was built from.
+        """
+        embed = discord.Embed(
+            title="Available Characters",
+            description=f"Sourced from [{SHEET_NAME}]({GOOGLE_SHEET_URL})\nRe-read from the sheet at most every {CACHE_TTL_SECS}s",
+            color=discord.Color.blurple(),
+        )
+        embed.set_thumbnail(url="https://raw.githubusercontent.com/EitanJoseph/polandball-art-helper/refs/heads/main/profile%20picx.png")
+
+        fields = (
+            fields_from_list("Sprites", sprite_available)
+            + fields_from_list("Splashes", splash_available)
+        )
+        for title, content, inline in fields:
+            embed.add_field(name=title, value=content, inline=False)
+        return embed
+
+    def best_token_match(self, q: str) -> Optional[str]:
+        """Return the key sharing the most words with `q`, or None if none do."""
+        counts: Dict[str, int] = {}
+        for t in dict.fromkeys(q.split()):
+            for k in self.tokens.get(t, ()):
+                counts[k] = counts.get(k, 0) + 1
+        if not counts:
+            return None
+        return max(counts, key=counts.__getitem__)
+
+    def candidates(self, q: str) -> List[str]:
+        """Return keys worth fuzzy-scoring against `q`.
+
+        Every key sharing a trigram with `q` is scored, whatever its length
+        (so "germny" still reaches "germanyball"). With no shared trigram at
+        all, only similar-length keys with the same first letter are scored
+        rather than every key.
+        """
+        hits: Set[str] = set()
+        for g in trigrams(q):
+            hits |= self.by_trigram.get(g, set())
+        if hits:
+            return [k for k in self.keys if k in hits]
+
+        lengths = range(len(q) - _LEN_SLACK, len(q) + _LEN_SLACK + 1)
+        return [k for n in lengths for k in self.by_len.get(n, ()) if k[:1] == q[:1]]
 
     def find(self, query: str) -> Tuple[Optional[CountryRecord], Optional[str]]:
         q = normalize_country(query)
@@ -280,21 +556,32 @@ class AvailabilityIndex:
         # Exact normalized match
         if q in self.by_norm:
             return self.by_norm[q], None
-        
-        keys = list(self.by_norm.keys())
-        
-        candidates = difflib.get_close_matches(q, keys, n=1, cutoff=0.75)
-        if candidates:
-            best = candidates[0]
-            return None, self.by_norm[best].country
 
-        # Try matching against normalized original names with a slightly lower cutoff
-        norm_map = {normalize_country(n): n for n in self.all_names if normalize_country(n)}
-        candidates2 = difflib.get_close_matches(q, list(norm_map.keys()), n=1, cutoff=0.6)
-        if candidates2:
-            return None, norm_map[candidates2[0]]
+        # Hash probe: the query's first word belongs to exactly one name, and
+        # that name also contains every other word of the query
+        words = q.split()
+        hits = self.tokens.get(words[0], ())
+        if len(hits) == 1 and (len(words) == 1 or set(words) <= set(hits[0].split())):
+            return None, self.by_norm[hits[0]].country
+
+        # Too short to fuzzy-match meaningfully
+        if len(q) < _MIN_FUZZY_LEN:
+            return None, None
+
+        keys = self.keys
+        candidates = self.candidates(q)
 
-        # Fallback: substring match
+        # Keys are already normalized, so skip rapidfuzz's default processor
+        match = process.extractOne(q, candidates, scorer=fuzz.WRatio, processor=None, score_cutoff=60)
+        if match is not None:
+            return None, self.by_norm[match[0]].country
+
+        # Fallback: the key sharing the most whole words with the query
+        best = self.best_token_match(q)
+        if best is not None:
+            return None, self.by_norm[best].country
+
+        # Last resort: substring match
         for k in keys:
             if q in k or k in q:
                 return None, self.by_norm[k].country
@@ -309,8 +596,20 @@ class PolandballBot(commands.Bot):
         intents.message_content = True
         super().__init__(command_prefix="/", intents=intents, help_command=None)
         self.sheet_client: Optional[SheetClient] = None
-        self.cache = Cache(ttl=CACHE_TTL_SECS)
-        self._command_lock = False
+        self.cache = Cache(
+            ttl=CACHE_TTL_SECS,
+            path=CACHE_FILE,
+            hard_ttl=CACHE_HARD_TTL_SECS,
+            stale_ttl=CACHE_STALE_TTL_SECS,
+        )
+        self._lookup_sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+        # Serializes sheet refreshes, and with them the lazy SheetClient() authorization
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def setup_hook(self):
+        # Runs once before login; reading and indexing the cache file is blocking work
+        await asyncio.to_thread(self.cache.load)
 
     async def on_ready(self):
         logger.info("Logged in as %s (id=%s)", self.user, self.user.id)
@@ -323,18 +622,69 @@ class PolandballBot(commands.Bot):
             )
         except Exception as e:
             logger.exception("Failed to sync commands: %s", e)
+        await self._prime_cache()
 
+    async def _prime_cache(self):
+        """Authorize and load the sheet before the first command needs it.
 
-    def _load_index(self) -> AvailabilityIndex:
+        `on_ready` also fires on reconnects; `_load_index` returns the cached data
+        while it is still fresh, so those don't refetch within the TTL.
+        """
+        started = time.perf_counter()
+        try:
+            idx = await self._load_index()
+        except Exception:
+            logger.exception("Failed to prime sheet cache")
+            return
+        logger.info(
+            "Primed sheet cache with %d record(s) in %.0fms",
+            len(idx.records),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _fetch_records(self) -> List[CountryRecord]:
+        # Blocking: authorizes on first use and hits the Sheets API.
+        # Only called from _refresh under _refresh_lock, so SheetClient is built once.
+        if self.sheet_client is None:
+            self.sheet_client = SheetClient()
+        return self.sheet_client.fetch_records()
+
+    async def _load_index(self) -> AvailabilityIndex:
+        """Return the cached index, refreshing at most once at a time.
+
+        Every command goes through here so concurrent cache misses share a
+        single Sheets fetch instead of each issuing their own.
+        """
         cached = self.cache.get()
-        if cached is None:
-            if self.sheet_client is None:
-                self.sheet_client = SheetClient()
-            records = self.sheet_client.fetch_records()
-            self.cache.set(records)
-        else:
-            records = cached
-        return AvailabilityIndex.build(records)
+        if cached is not None:
+            return cached
+
+        # Stale-while-revalidate: answer from expired data and re-fetch in the background
+        stale = self.cache.get_stale()
+        if stale is not None:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._background_refresh())
+            return stale
+
+        return await self._refresh()
+
+    async def _background_refresh(self):
+        try:
+            await self._refresh()
+        except Exception:
+            logger.exception("Background sheet refresh failed")
+
+    async def _refresh(self) -> AvailabilityIndex:
+        async with self._refresh_lock:
+            # Another command may have refreshed while we waited on the lock
+            cached = self.cache.get()
+            if cached is not None:
+                return cached
+            records = await asyncio.to_thread(self._fetch_records)
+            index = AvailabilityIndex.build(records)
+            self.cache.set(index)
+            await asyncio.to_thread(self.cache.save)
+            return index
 
 
 bot = PolandballBot()
@@ -345,7 +695,7 @@ bot = PolandballBot()
 async def available(interaction: discord.Interaction, character: Optional[str] = None):
     await interaction.response.defer()
     try:
-        idx = bot._load_index()
+        idx = await bot._load_index()
     except Exception as e:
         logger.exception("Sheet load failed")
         await interaction.followup.send(f"Sorry, I couldn't load the availability sheet: {e}")
@@ -354,71 +704,17 @@ async def available(interaction: discord.Interaction, character: Optional[str] =
     arg_str = (character or "").strip()
 
     if arg_str.lower() in {"ball", "balls", ""}:
-        sprite_list = sorted(
-            {r.country for r in idx.by_norm.values() if r.is_available("sprite") is True},
-            key=str.lower,
-        )
-        splash_list = sorted(
-            {r.country for r in idx.by_norm.values() if r.is_available("splash") is True},
-            key=str.lower,
-        )
-
-        # Helper to split long lists into multiple embed fields (Discord field limit ~1024 chars)
-        def fields_from_list(title: str, values: List[str]) -> List[Tuple[str, str, bool]]:
-            if not values:
-                return [(f"{title} (0)", "_none_", False)]
-
-            max_len = 900
-            chunks: List[List[str]] = [[]]
-            for v in sorted(values, key=str.lower):
-                current = chunks[-1]
-                candidate = "\n".join(current + [f"• {v}"])
-                if len(candidate) > max_len:
-                    chunks.append([f"• {v}"])
-                else:
-                    current.append(f"• {v}")
-
-            fields: List[Tuple[str, str, bool]] = []
-            for i, chunk in enumerate(chunks, start=1):
-                name_suffix = f" (page {i})" if len(chunks) > 1 else ""
-                fields.append((f"{title} ({len(values)}){name_suffix}", "\n".join(chunk), False))
-            return fields
-
-        embed = discord.Embed(
-            title="Available Characters",
-            description=f"Sourced from [{SHEET_NAME}]({GOOGLE_SHEET_URL})\nUpdated every {CACHE_TTL_SECS}s",
-            color=discord.Color.blurple(),
-        )
-        embed.set_thumbnail(url="https://raw.githubusercontent.com/EitanJoseph/polandball-art-helper/refs/heads/main/profile%20picx.png")
-
-        for title, content, inline in fields_from_list("Sprites", sprite_list):
-            embed.add_field(name=title, value=content, inline=False)
-        for title, content, inline in fields_from_list("Splashes", splash_list):
-            embed.add_field(name=title, value=content, inline=False)
-
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=idx.ball_embed)
         return
 
-    rec, suggestion = idx.find(arg_str)
+    # Fuzzy matching is CPU work; keep the event loop free while it runs
+    async with bot._lookup_sem:
+        rec, suggestion = await asyncio.to_thread(idx.find, arg_str)
     if rec:
-        s_sprite = rec.is_available("sprite")
-        s_splash = rec.is_available("splash")
-
-        if s_sprite is True:
-            sprite_status = "✅ **Available**"
-        elif s_sprite is False:
-            sprite_status = "☑️ **Claimed**"
-        else:
-            sprite_status = "⚪ **Unknown**"
-
-        if s_splash is True:
-            splash_status = "✅ **Available**"
-        elif s_splash is False:
-            splash_status = "☑️ **Claimed**"
-        else:
-            splash_status = "⚪ **Unknown**"
+        sprite_status = "✅ **Available**" if rec.sprite else "☑️ **Claimed**"
+        splash_status = "✅ **Available**" if rec.splash else "☑️ **Claimed**"
 
-        ig = rec.in_game_status()
+        ig = rec.in_game_status
         if ig is True:
             ig_text = "🟢 In Game"
         elif ig is False:
@@ -430,13 +726,13 @@ async def available(interaction: discord.Interaction, character: Optional[str] =
         if rec.sprite_artist:
             sprite_lines.append(f"Artist: `{rec.sprite_artist}`")
         if rec.sprite_rdy:
-            sprite_lines.append(f"Status: `{format_ready_flag(rec.sprite_rdy)}`")
+            sprite_lines.append(f"Status: `{rec.sprite_ready_label}`")
 
         splash_lines = [splash_status]
         if rec.splash_artist:
             splash_lines.append(f"Artist: `{rec.splash_artist}`")
         if rec.splash_rdy:
-            splash_lines.append(f"Status: `{format_ready_flag(rec.splash_rdy)}`")
+            splash_lines.append(f"Status: `{rec.splash_ready_label}`")
 
         embed = discord.Embed(
             title=rec.country,
@@ -459,6 +755,7 @@ async def available(interaction: discord.Interaction, character: Optional[str] =
         await interaction.followup.send("I couldn't find that country in the sheet.")
 
 
+@functools.lru_cache(maxsize=1024)
 def format_ready_flag(raw: str) -> str:
     s = (raw or "").strip().lower()
     if not s:
@@ -480,7 +777,13 @@ def ready_icon(label: str) -> str:
 
 @bot.tree.command(name="ping", description="Ping the bot")
 async def ping(interaction: discord.Interaction):
-    await interaction.response.send_message("pong")
+    # bot.latency is the last gateway heartbeat round trip, already measured by discord.py.
+    # It is inf until the first heartbeat ACK after a (re)connect and nan with no websocket.
+    latency = bot.latency
+    if not math.isfinite(latency):
+        await interaction.response.send_message("pong")
+        return
+    await interaction.response.send_message(f"pong — {round(latency * 1000)}ms")
 
 
 class ArtType(Enum):
@@ -506,65 +809,15 @@ async def artist(
     kind: app_commands.Choice[str] = None,
 ):
     await interaction.response.defer()
-
     art_type = (kind.value if kind else "both").lower()
 
-    # Load records (reuse cache logic)
+    # Load the index (reuse cache logic)
     try:
-        records = bot.cache.get()
-        if records is None:
-            if bot.sheet_client is None:
-                bot.sheet_client = SheetClient()
-            records = bot.sheet_client.fetch_records()
-            bot.cache.set(records)
+        idx = await bot._load_index()
     except Exception as e:
         logger.exception("Sheet load failed for /artist")
         await interaction.followup.send(f"Sorry, I couldn't load the sheet: {e}")
         return
-    
-    def normalize_name(s: str) -> str:
-        """
-        Normalize artist / query text for fuzzy matching:
-        - Unicode normalize (NFKD)
-        - keep only letters (drop emoji, punctuation, bullets, etc.)
-        - lowercase
-        """
-        if not s:
-            return ""
-        # decompose fancy unicode characters
-        s = unicodedata.normalize("NFKD", s)
-        # keep only alphabetic characters
-        s = "".join(ch for ch in s if ch.isalpha())
-        return s.lower()
-
-    FUZZY_THRESHOLD = 0.7  # or whatever you're using
-
-    def fuzzy_score(query: str, target: str) -> float:
-        """
-        Returns a similarity score between 0 and 1.
-
-        - If query is 1 letter, only treat exact 1-letter names as matches.
-        - If normalized query is a substring of normalized target (len >= 3), treat as strong match.
-        - Otherwise, use a fuzzy similarity ratio on normalized strings.
-        """
-        if not target:
-            return 0.0
-
-        q = normalize_name(query)
-        t = normalize_name(target)
-
-        if not q:
-            return 0.0
-
-        # one-letter special case
-        if len(q) == 1:
-            return 1.0 if t == q else 0.0
-
-        # substring boost: "bread" in "Bread_from_Seoul", "jose" in "Jose11santamari"
-        if len(q) >= 3 and q in t:
-            return 1.0
-
-        return difflib.SequenceMatcher(None, q, t).ratio()
 
     query = name.strip().lower()
     if not query:
@@ -573,32 +826,28 @@ async def artist(
         )
         return
 
-    matches_splash: List[CountryRecord] = []
-    matches_sprite: List[CountryRecord] = []
+    q = normalize_name(query)
+    splash_scores = idx.splash_artists.search(q)
+    sprite_scores = idx.sprite_artists.search(q)
 
-    # Track best score per artist name so we can pick the closest one for the title
-    artist_scores: Dict[str, float] = {}
+    # Keyed by country so a record reached through several matching artists is listed once
+    matches_splash: Dict[str, CountryRecord] = {
+        r.country: r for a in splash_scores for r in idx.splash_artists.records[a]
+    }
+    matches_sprite: Dict[str, CountryRecord] = {
+        r.country: r for a in sprite_scores for r in idx.sprite_artists.records[a]
+    }
 
-    for r in records:
-        raw_splash = (r.splash_artist or "").strip()
-        raw_sprite = (r.sprite_artist or "").strip()
-
-        splash_score = fuzzy_score(query, raw_splash) if raw_splash else 0.0
-        sprite_score = fuzzy_score(query, raw_sprite) if raw_sprite else 0.0
-
-        if splash_score >= FUZZY_THRESHOLD:
-            matches_splash.append(r)
-            artist_scores[raw_splash] = max(artist_scores.get(raw_splash, 0.0), splash_score)
-
-        if sprite_score >= FUZZY_THRESHOLD:
-            matches_sprite.append(r)
-            artist_scores[raw_sprite] = max(artist_scores.get(raw_sprite, 0.0), sprite_score)
+    # Track best score per artist name so we can pick the closest one for the title
+    artist_scores: Dict[str, float] = dict(splash_scores)
+    for a, score in sprite_scores.items():
+        artist_scores[a] = max(artist_scores.get(a, 0.0), score)
 
     # Apply type filter *after* we've collected matches
     if art_type == "splash":
-        matches_sprite = []
+        matches_sprite = {}
     elif art_type == "sprite":
-        matches_splash = []
+        matches_splash = {}
 
     if not matches_splash and not matches_sprite:
         await interaction.followup.send(
@@ -621,7 +870,7 @@ async def artist(
     )
     embed.set_thumbnail(url="https://polandballgo.com/assets/logo.png")
 
-    def format_list(title: str, recs: List[CountryRecord], get_flag) -> None:
+    def format_list(title: str, recs: List[CountryRecord], get_label) -> None:
         if not recs:
         # consistent bold + count even when empty
             embed.add_field(
@@ -631,8 +880,6 @@ async def artist(
             )
             return
 
-        recs_sorted = sorted(recs, key=lambda r: r.country.lower())
-
         buckets = {
             "Complete": [],
             "In progress": [],
@@ -640,14 +887,13 @@ async def artist(
             "Other": [],
         }
 
-        for r in recs_sorted:
-            label = format_ready_flag(get_flag(r))
-            if label not in buckets:
-                buckets["Other"].append(r)
-            else:
-                buckets[label].append(r)
+        other = buckets["Other"]
+        for r in recs:
+            buckets.get(get_label(r), other).append(r)
 
         max_len = 1000  # keep some headroom under Discord's 1024 limit
+        # Every line costs at least len("• X\n"), so only this many can ever be shown
+        max_visible = max_len // 4
         lines: List[str] = []
         current_len = 0
         hidden_count = 0
@@ -670,13 +916,15 @@ async def artist(
             lines.append(header)
             current_len += len(header) + 1  # + newline
 
-            for r in items:
+            # Only sort the prefix that can fit instead of the whole bucket
+            visible = heapq.nsmallest(max_visible, items, key=lambda r: r.country.lower())
+            for i, r in enumerate(visible):
                 line = f"• {r.country}"
                 if current_len + len(line) + 1 > max_len:
                     # count this item + all remaining items in all remaining buckets
                     hidden_count += 1  # this one
                     # remaining in this bucket
-                    remaining_here = len(items) - (items.index(r) + 1)
+                    remaining_here = len(items) - (i + 1)
                     hidden_count += remaining_here
                     # remaining in later buckets
                     for later_label in order[order.index(label) + 1:]:
@@ -704,28 +952,31 @@ async def artist(
         value = "\n".join(lines)
 
         embed.add_field(
-            name=f"**{title} ({len(recs_sorted)}**)",  
+            name=f"**{title} ({len(recs)}**)",  
             value=value,
             inline=False,
         )
 
 
     if art_type in ("both", "splash"):
-        format_list("*🎨 Splash Art*", matches_splash, lambda r: r.splash_rdy)
+        format_list("*🎨 Splash Art*", list(matches_splash.values()), lambda r: r.splash_ready_label)
 
     if art_type in ("both", "sprite"):
         divider = "⠂" * 12
         embed.add_field(name=divider, value="", inline=False)
-        format_list("*🎨 Sprite Art*", matches_sprite, lambda r: r.sprite_rdy)
+        format_list("*🎨 Sprite Art*", list(matches_sprite.values()), lambda r: r.sprite_ready_label)
 
     await interaction.followup.send(embed=embed)
 
+_HEALTH_RESP = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nOK"
+
+
 async def handle_client(reader, writer):
     try:
+        # Drain the request so closing doesn't reset the connection before the probe reads the reply
         await reader.read(1024)
-        response = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK"
-        writer.write(response)
-        await writer.drain()
+        # The reply fits in the socket buffer and close() flushes it, so no drain() round trip
+        writer.write(_HEALTH_RESP)
     finally:
         writer.close()
         await writer.wait_closed()
@@ -735,7 +986,9 @@ async def main():
     if not DISCORD_TOKEN:
         raise RuntimeError("DISCORD_TOKEN env var is required.")
     port = int(os.getenv("PORT", "8080"))
-    server = await asyncio.start_server(handle_client, host="0.0.0.0", port=port)
+    server = await asyncio.start_server(
+        handle_client, host="0.0.0.0", port=port, backlog=128
+    )
     async with server:
         await asyncio.gather(
             bot.start(DISCORD_TOKEN),